@@ -0,0 +1,57 @@
+import pytest
+
+from vllm.engine.output_processor.util import create_output_by_sequence_group
+from vllm.sequence import (CompletionSequenceGroupOutput, SamplerOutput,
+                           SequenceOutput)
+
+
+def create_sampler_output(token_ids):
+    outputs = []
+    for token_id in token_ids:
+        sample = SequenceOutput(parent_seq_id=0,
+                                output_token=token_id,
+                                logprobs={})
+        outputs.append(
+            CompletionSequenceGroupOutput(samples=[sample],
+                                          prompt_logprobs=None))
+    return SamplerOutput(outputs=outputs)
+
+
+@pytest.mark.parametrize("num_steps", [1, 2, 4])
+@pytest.mark.parametrize("num_seq_groups", [0, 1, 3])
+@pytest.mark.skip_global_cleanup
+def test_create_output_by_sequence_group(num_steps: int, num_seq_groups: int):
+    outputs = [
+        create_sampler_output(
+            [step * num_seq_groups + i for i in range(num_seq_groups)])
+        for step in range(num_steps)
+    ]
+
+    output_by_sequence_group = create_output_by_sequence_group(
+        outputs, num_seq_groups=num_seq_groups)
+
+    assert len(output_by_sequence_group) == num_seq_groups
+    for i, group_outputs in enumerate(output_by_sequence_group):
+        assert group_outputs == [outputs[step][i] for step in range(num_steps)]
+
+
+@pytest.mark.parametrize("step_sizes", [[2], [3, 2], [3, 1, 3], [0, 3, 2]])
+@pytest.mark.skip_global_cleanup
+def test_create_output_by_sequence_group_uneven_steps(step_sizes):
+    """Steps with fewer outputs than sequence groups only extend the first
+    groups"""
+    num_seq_groups = 3
+    outputs = [
+        create_sampler_output(
+            [step * num_seq_groups + i for i in range(step_size)])
+        for step, step_size in enumerate(step_sizes)
+    ]
+
+    output_by_sequence_group = create_output_by_sequence_group(
+        outputs, num_seq_groups=num_seq_groups)
+
+    assert len(output_by_sequence_group) == num_seq_groups
+    for i, group_outputs in enumerate(output_by_sequence_group):
+        assert group_outputs == [
+            step.outputs[i] for step in outputs if i < len(step)
+        ]
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from vllm.engine import llm_engine
+from vllm.engine.llm_engine import _load_generation_config_dict
+
+MODEL_CONFIG = SimpleNamespace(model="test-model", revision=None)
+
+
+@pytest.fixture(autouse=True)
+def clear_generation_config_cache():
+    llm_engine._get_generation_config_dict.cache_clear()
+    yield
+    llm_engine._get_generation_config_dict.cache_clear()
+
+
+def _generation_config(config_dict):
+    generation_config = MagicMock()
+    generation_config.to_diff_dict.return_value = config_dict
+    return generation_config
+
+
+@pytest.mark.skip_global_cleanup
+def test_generation_config_cache_hit():
+    generation_config = _generation_config({"eos_token_id": [1, 2]})
+    with patch.object(llm_engine.GenerationConfig,
+                      "from_pretrained",
+                      return_value=generation_config) as from_pretrained:
+        first = _load_generation_config_dict(MODEL_CONFIG)
+        second = _load_generation_config_dict(MODEL_CONFIG)
+
+    from_pretrained.assert_called_once_with("test-model", revision=None)
+    assert first == second == {"eos_token_id": [1, 2]}
+
+    # Each engine gets its own copy, including nested lists.
+    first["eos_token_id"].append(3)
+    assert second == {"eos_token_id": [1, 2]}
+    assert _load_generation_config_dict(MODEL_CONFIG) == {
+        "eos_token_id": [1, 2]
+    }
+
+
+@pytest.mark.skip_global_cleanup
+def test_generation_config_failure_not_cached():
+    generation_config = _generation_config({"temperature": 0.5})
+    with patch.object(llm_engine.GenerationConfig,
+                      "from_pretrained",
+                      side_effect=[OSError,
+                                   generation_config]) as from_pretrained:
+        assert _load_generation_config_dict(MODEL_CONFIG) == {}
+        assert _load_generation_config_dict(MODEL_CONFIG) == {
+            "temperature": 0.5
+        }
+
+    assert from_pretrained.call_count == 2
+
+
+@pytest.mark.skip_global_cleanup
+def test_generation_config_local_dir_not_cached(tmp_path):
+    model_config = SimpleNamespace(model=str(tmp_path), revision=None)
+    with patch.object(llm_engine.GenerationConfig,
+                      "from_pretrained",
+                      side_effect=[
+                          _generation_config({"temperature": 0.5}),
+                          _generation_config({"temperature": 0.7}),
+                      ]) as from_pretrained:
+        # The directory's generation_config.json may be rewritten between
+        # engines, so every load reads it again.
+        assert _load_generation_config_dict(model_config) == {
+            "temperature": 0.5
+        }
+        assert _load_generation_config_dict(model_config) == {
+            "temperature": 0.7
+        }
+
+    assert from_pretrained.call_count == 2
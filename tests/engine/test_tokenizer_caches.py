@@ -0,0 +1,146 @@
+import weakref
+from unittest.mock import patch
+
+import pytest
+
+from vllm.engine.arg_utils import EngineArgs
+from vllm.engine.llm_engine import (_TOKENIZATION_CACHE_MAX_PROMPT_LEN,
+                                    LLMEngine)
+from vllm.lora.request import LoRARequest
+
+from ..conftest import cleanup
+
+MODEL_NAME = "facebook/opt-125m"
+
+# LoRA is not enabled on the engine, so the tokenizer group falls back to the
+# base tokenizer for this request; only its lora_int_id matters here.
+LORA_REQUEST = LoRARequest("adapter", 1, "/nonexistent/lora")
+
+
+@pytest.fixture(scope="module")
+def engine():
+    # pytest caches the fixture so we use weakref.proxy to
+    # enable garbage collection
+    engine = LLMEngine.from_engine_args(
+        EngineArgs(model=MODEL_NAME,
+                   gpu_memory_utilization=0.10,
+                   enforce_eager=True,
+                   tokenization_cache_size=16))
+
+    yield weakref.proxy(engine)
+
+    del engine
+
+    cleanup()
+
+
+@pytest.mark.skip_global_cleanup
+def test_eos_token_id_cache(engine: LLMEngine):
+    engine._eos_token_id_cache.clear()
+    eos_token_id = engine.tokenizer.tokenizer.eos_token_id
+
+    with patch.object(engine.tokenizer,
+                      "get_lora_tokenizer",
+                      wraps=engine.tokenizer.get_lora_tokenizer) as spy:
+        assert engine._get_eos_token_id(None) == eos_token_id
+        assert engine._get_eos_token_id(None) == eos_token_id
+        assert spy.call_count == 1
+
+        assert engine._get_eos_token_id(LORA_REQUEST) == eos_token_id
+        assert engine._get_eos_token_id(LORA_REQUEST) == eos_token_id
+        assert spy.call_count == 2
+
+    assert engine._eos_token_id_cache == {0: eos_token_id, 1: eos_token_id}
+
+
+@pytest.mark.skip_global_cleanup
+def test_remove_lora_invalidates_eos_token_id(engine: LLMEngine):
+    engine._eos_token_id_cache.clear()
+    engine._get_eos_token_id(None)
+    engine._get_eos_token_id(LORA_REQUEST)
+
+    with patch.object(engine.model_executor, "remove_lora",
+                      return_value=True) as remove_lora:
+        assert engine.remove_lora(LORA_REQUEST.lora_int_id)
+        remove_lora.assert_called_once_with(LORA_REQUEST.lora_int_id)
+
+    assert LORA_REQUEST.lora_int_id not in engine._eos_token_id_cache
+    assert 0 in engine._eos_token_id_cache
+
+
+@pytest.mark.skip_global_cleanup
+def test_tokenization_cache_hit_skips_encode(engine: LLMEngine):
+    engine._tokenization_cache.clear()
+    prompt = "Hello, my name is"
+
+    with patch.object(engine.tokenizer,
+                      "encode",
+                      wraps=engine.tokenizer.encode) as encode:
+        prompt_token_ids = engine._tokenize_prompt(prompt, "0", None)
+        assert engine._tokenize_prompt(prompt, "1", None) == prompt_token_ids
+        assert encode.call_count == 1
+
+    assert prompt_token_ids == engine.tokenizer.encode(prompt)
+
+
+@pytest.mark.skip_global_cleanup
+def test_tokenization_cache_returns_fresh_list(engine: LLMEngine):
+    engine._tokenization_cache.clear()
+    prompt = "The capital of France is"
+
+    prompt_token_ids = engine._tokenize_prompt(prompt, "0", None)
+    expected = list(prompt_token_ids)
+
+    cached_token_ids = engine._tokenize_prompt(prompt, "1", None)
+    assert cached_token_ids is not prompt_token_ids
+    cached_token_ids.append(-1)
+
+    assert engine._tokenize_prompt(prompt, "2", None) == expected
+
+
+@pytest.mark.skip_global_cleanup
+def test_tokenization_cache_skips_long_prompts(engine: LLMEngine):
+    engine._tokenization_cache.clear()
+    prompt = "a" * (_TOKENIZATION_CACHE_MAX_PROMPT_LEN + 1)
+
+    with patch.object(engine.tokenizer,
+                      "encode",
+                      wraps=engine.tokenizer.encode) as encode:
+        engine._tokenize_prompt(prompt, "0", None)
+        engine._tokenize_prompt(prompt, "1", None)
+        assert encode.call_count == 2
+
+    assert len(engine._tokenization_cache) == 0
+
+
+@pytest.mark.skip_global_cleanup
+def test_tokenization_cache_disabled(engine: LLMEngine, monkeypatch):
+    monkeypatch.setattr(engine, "_tokenization_cache", None)
+    prompt = "The future of AI is"
+
+    with patch.object(engine.tokenizer,
+                      "encode",
+                      wraps=engine.tokenizer.encode) as encode:
+        engine._tokenize_prompt(prompt, "0", None)
+        engine._tokenize_prompt(prompt, "1", None)
+        assert encode.call_count == 2
+
+
+@pytest.mark.skip_global_cleanup
+def test_remove_lora_invalidates_tokenization_cache(engine: LLMEngine):
+    engine._tokenization_cache.clear()
+    other_lora_request = LoRARequest("other", 2, "/nonexistent/other")
+    prompt = "The president of the United States is"
+
+    for lora_request in [None, LORA_REQUEST, other_lora_request]:
+        engine._tokenize_prompt(prompt, "0", lora_request)
+    assert len(engine._tokenization_cache) == 3
+
+    with patch.object(engine.model_executor, "remove_lora", return_value=True):
+        engine.remove_lora(LORA_REQUEST.lora_int_id)
+
+    cache = engine._tokenization_cache
+    assert cache.get_prompt_token_ids(LORA_REQUEST.lora_int_id, prompt) is None
+    assert cache.get_prompt_token_ids(0, prompt) is not None
+    assert cache.get_prompt_token_ids(other_lora_request.lora_int_id,
+                                      prompt) is not None
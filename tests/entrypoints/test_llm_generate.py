@@ -1,9 +1,11 @@
 import weakref
 from typing import List
+from unittest.mock import patch
 
 import pytest
 
 from vllm import LLM, RequestOutput, SamplingParams
+from vllm.inputs import TextPrompt, TokensPrompt
 
 from ..conftest import cleanup
 
@@ -142,3 +144,74 @@ def test_multiple_sampling_params(llm: LLM):
     # sampling_params is None, default params should be applied
     outputs = llm.generate(PROMPTS, sampling_params=None)
     assert len(PROMPTS) == len(outputs)
+
+
+@pytest.mark.skip_global_cleanup
+def test_batched_tokenization_of_mixed_inputs(llm: LLM):
+    multi_modal_data = object()
+    tokens_prompt = TokensPrompt(prompt_token_ids=TOKEN_IDS[3])
+    inputs = [
+        PROMPTS[0],
+        TextPrompt(prompt=PROMPTS[1]),
+        tokens_prompt,
+        TextPrompt(prompt=PROMPTS[2], multi_modal_data=multi_modal_data),
+        PROMPTS[3],
+    ]
+
+    # Only check what reaches the engine; nothing is actually generated.
+    with patch.object(llm.llm_engine, "add_request") as add_request:
+        llm.generate(inputs, sampling_params=SamplingParams(), use_tqdm=False)
+
+    engine_inputs = [call.args[1] for call in add_request.call_args_list]
+    assert len(engine_inputs) == len(inputs)
+
+    # Pre-tokenized prompts are passed through unchanged.
+    assert engine_inputs[2] is tokens_prompt
+
+    # Text prompts are tokenized exactly as the engine would per request.
+    tokenizer = llm.llm_engine.tokenizer
+    for i, prompt in [(0, PROMPTS[0]), (1, PROMPTS[1]), (3, PROMPTS[2]),
+                      (4, PROMPTS[3])]:
+        assert engine_inputs[i]["prompt"] == prompt
+        assert engine_inputs[i]["prompt_token_ids"] == tokenizer.encode(prompt)
+
+    assert engine_inputs[3]["multi_modal_data"] is multi_modal_data
+    assert "multi_modal_data" not in engine_inputs[1]
+
+
+@pytest.mark.skip_global_cleanup
+def test_batched_tokenization_uses_tokenization_cache(llm: LLM):
+    engine = llm.llm_engine
+    engine._tokenization_cache.clear()
+    tokenizer = engine.tokenizer
+    inputs = [
+        PROMPTS[0], PROMPTS[1], PROMPTS[0],
+        TextPrompt(prompt=PROMPTS[1])
+    ]
+
+    with patch.object(engine, "add_request") as add_request, \
+            patch.object(tokenizer, "encode_batch",
+                         wraps=tokenizer.encode_batch) as encode_batch:
+        # Repeated prompts are only encoded once.
+        llm.generate(inputs, sampling_params=SamplingParams(), use_tqdm=False)
+        assert encode_batch.call_count == 1
+        assert encode_batch.call_args.args[0] == [PROMPTS[0], PROMPTS[1]]
+
+        # Cache hits are not re-encoded; only the new prompt is.
+        llm.generate(inputs + [PROMPTS[2]],
+                     sampling_params=SamplingParams(),
+                     use_tqdm=False)
+        assert encode_batch.call_count == 2
+        assert encode_batch.call_args.args[0] == [PROMPTS[2]]
+
+    engine_inputs = [call.args[1] for call in add_request.call_args_list]
+    assert len(engine_inputs) == 2 * len(inputs) + 1
+    for request_inputs in engine_inputs:
+        assert request_inputs["prompt_token_ids"] == tokenizer.encode(
+            request_inputs["prompt"])
+
+    # Every request gets its own token id list.
+    assert len({
+        id(request_inputs["prompt_token_ids"])
+        for request_inputs in engine_inputs
+    }) == len(engine_inputs)
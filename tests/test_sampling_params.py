@@ -8,6 +8,42 @@ def test_max_tokens_none():
     SamplingParams(temperature=0.01, top_p=0.1, max_tokens=None)
 
 
+def test_clone():
+    """clone() should not share mutable state, except LogitsProcessors"""
+
+    def logits_processor(token_ids, logits):
+        return logits
+
+    params = SamplingParams(stop=["stop"],
+                            stop_token_ids=[1],
+                            logits_processors=[logits_processor])
+    cloned = params.clone()
+
+    cloned.stop.append("other")
+    cloned.stop_token_ids.append(2)
+    cloned.all_stop_token_ids.add(3)
+    cloned.logits_processors.append(logits_processor)
+
+    assert params.stop == ["stop"]
+    assert params.stop_token_ids == [1]
+    assert params.all_stop_token_ids == {1}
+    assert params.logits_processors == [logits_processor]
+    assert cloned.logits_processors[0] is logits_processor
+
+
+def test_clone_tuple_logits_processors():
+    """clone() should accept logits processors passed as a tuple"""
+
+    def logits_processor(token_ids, logits):
+        return logits
+
+    params = SamplingParams(logits_processors=(logits_processor, ))
+    cloned = params.clone()
+
+    assert cloned.logits_processors == [logits_processor]
+    assert params.logits_processors == (logits_processor, )
+
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__])
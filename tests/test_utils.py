@@ -5,7 +5,7 @@ from typing import (TYPE_CHECKING, Any, AsyncIterator, Awaitable, Protocol,
 
 import pytest
 
-from vllm.utils import deprecate_kwargs, merge_async_iterators
+from vllm.utils import Counter, deprecate_kwargs, merge_async_iterators
 
 from .utils import error_on_warning
 
@@ -116,3 +116,11 @@ def test_deprecate_kwargs_additional_message():
 
     with pytest.warns(DeprecationWarning, match="abcd"):
         dummy(old_arg=1)
+
+
+def test_counter_next_n():
+    counter = Counter()
+    assert next(counter) == 0
+    assert list(counter.next_n(3)) == [1, 2, 3]
+    assert list(counter.next_n(0)) == []
+    assert next(counter) == 4
@@ -36,6 +36,21 @@ async def test_tokenizer_group(tokenizer_group_type):
         None) == await tokenizer_group.get_lora_tokenizer_async(None)
 
 
+@pytest.mark.parametrize("tokenizer_group_type", [None, "ray"])
+def test_tokenizer_group_encode_batch(tokenizer_group_type):
+    reference_tokenizer = AutoTokenizer.from_pretrained("gpt2")
+    tokenizer_group = get_tokenizer_group(
+        get_tokenizer_pool_config(tokenizer_group_type),
+        tokenizer_id="gpt2",
+        enable_lora=False,
+        max_num_seqs=1,
+        max_input_length=None,
+    )
+    prompts = ["prompt", "a longer prompt", "prompt"]
+    assert [reference_tokenizer.encode(prompt) for prompt in prompts
+            ] == tokenizer_group.encode_batch(prompts, lora_request=None)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("tokenizer_group_type", ["ray"])
 async def test_tokenizer_group_pool(tokenizer_group_type):
@@ -79,6 +79,10 @@ class ModelConfig:
             matches the model name exposed via the APIs. If multiple model 
             names provided, the first name will be used. If not specified, 
             the model name will be the same as `model`.
+        tokenization_cache_size: Number of tokenized prompts the engine keeps
+            for reuse when the same prompt is submitted again. If 0, the
+            cache is disabled. A full cache of long prompts can take several
+            hundred MB of host memory at the default size.
     """
 
     def __init__(
@@ -103,6 +107,7 @@ class ModelConfig:
         disable_sliding_window: bool = False,
         skip_tokenizer_init: bool = False,
         served_model_name: Optional[Union[str, List[str]]] = None,
+        tokenization_cache_size: int = 4096,
     ) -> None:
         self.model = model
         self.tokenizer = tokenizer
@@ -125,6 +130,10 @@ class ModelConfig:
         self.max_logprobs = max_logprobs
         self.disable_sliding_window = disable_sliding_window
         self.skip_tokenizer_init = skip_tokenizer_init
+        if tokenization_cache_size < 0:
+            raise ValueError("tokenization_cache_size must be non-negative, "
+                             f"got {tokenization_cache_size}.")
+        self.tokenization_cache_size = tokenization_cache_size
 
         self.hf_config = get_config(self.model, trust_remote_code, revision,
                                     code_revision, rope_scaling)
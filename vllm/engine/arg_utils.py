@@ -61,6 +61,7 @@ class EngineArgs:
     tokenizer_pool_size: int = 0
     tokenizer_pool_type: str = "ray"
     tokenizer_pool_extra_config: Optional[dict] = None
+    tokenization_cache_size: int = 4096
     enable_lora: bool = False
     max_loras: int = 1
     max_lora_rank: int = 16
@@ -383,6 +384,18 @@ class EngineArgs:
                             'This should be a JSON string that will be '
                             'parsed into a dictionary. Ignored if '
                             'tokenizer_pool_size is 0.')
+        parser.add_argument('--tokenization-cache-size',
+                            type=int,
+                            default=EngineArgs.tokenization_cache_size,
+                            help='Number of tokenized prompts to keep for '
+                            'reuse when the same prompt is submitted '
+                            'again. If 0, the cache is disabled. Prompts '
+                            'of up to 16K characters are cached, and each '
+                            'entry is held as Python ints, so a full cache '
+                            'of long prompts can take several hundred MB '
+                            'of host memory at the default size (over 2 GB '
+                            'in the worst case). Lower this value if host '
+                            'memory is tight.')
         # LoRA related configs
         parser.add_argument('--enable-lora',
                             action='store_true',
@@ -564,7 +577,8 @@ class EngineArgs:
             self.quantization_param_path, self.enforce_eager,
             self.max_context_len_to_capture, self.max_seq_len_to_capture,
             self.max_logprobs, self.disable_sliding_window,
-            self.skip_tokenizer_init, self.served_model_name)
+            self.skip_tokenizer_init, self.served_model_name,
+            self.tokenization_cache_size)
         cache_config = CacheConfig(self.block_size,
                                    self.gpu_memory_utilization,
                                    self.swap_space, self.kv_cache_dtype,
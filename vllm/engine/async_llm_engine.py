@@ -251,23 +251,44 @@ class _AsyncLLMEngine(LLMEngine):
         inputs: PromptInputs,
         lora_request: Optional[LoRARequest] = None,
     ) -> LLMInputs:
-        if isinstance(inputs, str):
-            inputs = {"prompt": inputs}
-
-        if "prompt_token_ids" not in inputs:
-            tokenizer = self.get_tokenizer_group("prompts must be None if "
-                                                 "skip_tokenizer_init is True")
+        if isinstance(inputs, dict):
+            # Pre-tokenized prompts (e.g. from the OpenAI server) are the
+            # common case, so check for them first.
+            prompt_token_ids = inputs.get("prompt_token_ids")
+            if prompt_token_ids is None:
+                prompt_token_ids = await self._tokenize_prompt_async(
+                    inputs["prompt"], request_id, lora_request)
+
+            return LLMInputs(prompt_token_ids=prompt_token_ids,
+                             prompt=inputs.get("prompt"),
+                             multi_modal_data=inputs.get("multi_modal_data"))
+
+        prompt_token_ids = await self._tokenize_prompt_async(
+            inputs, request_id, lora_request)
+        return LLMInputs(prompt_token_ids=prompt_token_ids,
+                         prompt=inputs,
+                         multi_modal_data=None)
 
+    async def _tokenize_prompt_async(
+        self,
+        prompt: str,
+        request_id: str,
+        lora_request: Optional[LoRARequest],
+    ) -> List[int]:
+        tokenizer = self.get_tokenizer_group("prompts must be None if "
+                                             "skip_tokenizer_init is True")
+
+        prompt_token_ids = self._get_cached_prompt_token_ids(
+            prompt, lora_request)
+        if prompt_token_ids is None:
             prompt_token_ids = await tokenizer.encode_async(
                 request_id=request_id,
-                prompt=inputs["prompt"],
+                prompt=prompt,
                 lora_request=lora_request)
-        else:
-            prompt_token_ids = inputs["prompt_token_ids"]
+            self._cache_prompt_token_ids(prompt, lora_request,
+                                         prompt_token_ids)
 
-        return LLMInputs(prompt_token_ids=prompt_token_ids,
-                         prompt=inputs.get("prompt"),
-                         multi_modal_data=inputs.get("multi_modal_data"))
+        return prompt_token_ids
 
     async def add_request_async(
         self,
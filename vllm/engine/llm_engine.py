@@ -1,8 +1,12 @@
+import copy
+import logging
+import os
 import time
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, ClassVar, Iterable, List, Optional
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Hashable, Iterable, List, Optional
 from typing import Sequence as GenericSequence
-from typing import Type, TypeVar, Union
+from typing import Set, Tuple, Type, TypeVar, Union, cast
 
 from transformers import GenerationConfig, PreTrainedTokenizer
 
@@ -37,22 +41,91 @@ from vllm.transformers_utils.tokenizer_group import (BaseTokenizerGroup,
                                                      get_tokenizer_group)
 from vllm.usage.usage_lib import (UsageContext, is_usage_stats_enabled,
                                   usage_message)
-from vllm.utils import Counter
+from vllm.utils import Counter, LRUCache
 
 logger = init_logger(__name__)
 _LOCAL_LOGGING_INTERVAL_SEC = 5
+# Prompts longer than this many characters are never cached.
+_TOKENIZATION_CACHE_MAX_PROMPT_LEN = 16 * 1024
 
 
-def _load_generation_config_dict(model_config: ModelConfig):
+def _read_generation_config_dict(model: str,
+                                 revision: Optional[str]) -> Dict[str, Any]:
+    # Raises OSError if there is no generation config.
+    return GenerationConfig.from_pretrained(
+        model,
+        revision=revision,
+    ).to_diff_dict()
+
+
+@lru_cache(maxsize=32)
+def _get_generation_config_dict(model: str,
+                                revision: Optional[str]) -> Dict[str, Any]:
+    # lru_cache does not cache exceptions, so a failed load is retried by the
+    # next engine.
+    return _read_generation_config_dict(model, revision)
+
+
+def _load_generation_config_dict(model_config: ModelConfig) -> Dict[str, Any]:
+    # Configs of hub models are cached so that constructing several engines
+    # for the same model does not hit the HF hub again. A local model
+    # directory is read every time instead: its generation_config.json may be
+    # rewritten during the process (e.g. between fine-tuning runs), and
+    # reading it from disk is cheap.
     try:
-        return GenerationConfig.from_pretrained(
-            model_config.model,
-            revision=model_config.revision,
-        ).to_diff_dict()
+        if os.path.isdir(model_config.model):
+            return _read_generation_config_dict(model_config.model,
+                                                model_config.revision)
+        config_dict = _get_generation_config_dict(model_config.model,
+                                                  model_config.revision)
     except OSError:
         # Not found.
         return {}
 
+    # The cached dict is shared by all engines for this model, and some of
+    # its values are lists (e.g. eos_token_id), so hand out a deep copy.
+    return copy.deepcopy(config_dict)
+
+
+class _TokenizationCache(LRUCache[Tuple[int, ...]]):
+    """LRU cache of prompt token ids keyed by ``(lora_int_id, prompt)``.
+
+    The keys of each LoRA adapter are tracked so that its entries can be
+    dropped when the adapter is removed, without scanning the whole cache.
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._keys_by_lora: Dict[int, Set[Tuple[int, str]]] = {}
+
+    def get_prompt_token_ids(self, lora_int_id: int,
+                             prompt: str) -> Optional[Tuple[int, ...]]:
+        return self.get((lora_int_id, prompt))
+
+    def put_prompt_token_ids(self, lora_int_id: int, prompt: str,
+                             prompt_token_ids: Tuple[int, ...]) -> None:
+        key = (lora_int_id, prompt)
+        self._keys_by_lora.setdefault(lora_int_id, set()).add(key)
+        self.put(key, prompt_token_ids)
+
+    def remove_lora(self, lora_int_id: int) -> None:
+        for key in self._keys_by_lora.pop(lora_int_id, ()):
+            self.pop(key)
+
+    def _on_remove(
+        self,
+        key: Hashable,
+        value: Optional[Tuple[int, ...]],
+    ) -> None:
+        # Only put_prompt_token_ids inserts entries, so every key is a
+        # (lora_int_id, prompt) tuple.
+        lora_key = cast(Tuple[int, str], key)
+        lora_keys = self._keys_by_lora.get(lora_key[0])
+        if lora_keys is not None:
+            lora_keys.discard(lora_key)
+            if not lora_keys:
+                del self._keys_by_lora[lora_key[0]]
+
 
 _O = TypeVar("_O", RequestOutput, EmbeddingRequestOutput)
 
@@ -109,10 +182,10 @@ class LLMEngine:
         output: object,
         output_type: Type[_O],
     ) -> _O:
-        do_validate = cls.DO_VALIDATE_OUTPUT
+        if not cls.DO_VALIDATE_OUTPUT:
+            return output  # type: ignore[return-value]
 
-        if ((TYPE_CHECKING or do_validate)
-                and not isinstance(output, output_type)):
+        if not isinstance(output, output_type):
             raise TypeError(f"Expected output of type {output_type}, "
                             f"but found type {type(output)}")
 
@@ -124,19 +197,16 @@ class LLMEngine:
         outputs: GenericSequence[object],
         output_type: Type[_O],
     ) -> List[_O]:
-        do_validate = cls.DO_VALIDATE_OUTPUT
+        if not cls.DO_VALIDATE_OUTPUT:
+            return outputs  # type: ignore[return-value]
 
-        outputs_: List[_O]
-        if TYPE_CHECKING or do_validate:
-            outputs_ = []
-            for output in outputs:
-                if not isinstance(output, output_type):
-                    raise TypeError(f"Expected output of type {output_type}, "
-                                    f"but found type {type(output)}")
+        outputs_: List[_O] = []
+        for output in outputs:
+            if not isinstance(output, output_type):
+                raise TypeError(f"Expected output of type {output_type}, "
+                                f"but found type {type(output)}")
 
-                outputs_.append(output)
-        else:
-            outputs_ = outputs
+            outputs_.append(output)
 
         return outputs_
 
@@ -158,42 +228,43 @@ class LLMEngine:
         log_stats: bool,
         usage_context: UsageContext = UsageContext.ENGINE_CONTEXT,
     ) -> None:
-        logger.info(
-            "Initializing an LLM engine (v%s) with config: "
-            "model=%r, speculative_config=%r, tokenizer=%r, "
-            "skip_tokenizer_init=%s, tokenizer_mode=%s, revision=%s, "
-            "rope_scaling=%r, tokenizer_revision=%s, "
-            "trust_remote_code=%s, dtype=%s, max_seq_len=%d, "
-            "download_dir=%r, load_format=%s, tensor_parallel_size=%d, "
-            "disable_custom_all_reduce=%s, quantization=%s, "
-            "enforce_eager=%s, kv_cache_dtype=%s, "
-            "quantization_param_path=%s, device_config=%s, "
-            "decoding_config=%r, seed=%d, served_model_name=%s)",
-            vllm.__version__,
-            model_config.model,
-            speculative_config,
-            model_config.tokenizer,
-            model_config.skip_tokenizer_init,
-            model_config.tokenizer_mode,
-            model_config.revision,
-            model_config.rope_scaling,
-            model_config.tokenizer_revision,
-            model_config.trust_remote_code,
-            model_config.dtype,
-            model_config.max_model_len,
-            load_config.download_dir,
-            load_config.load_format,
-            parallel_config.tensor_parallel_size,
-            parallel_config.disable_custom_all_reduce,
-            model_config.quantization,
-            model_config.enforce_eager,
-            cache_config.cache_dtype,
-            model_config.quantization_param_path,
-            device_config.device,
-            decoding_config,
-            model_config.seed,
-            model_config.served_model_name,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Initializing an LLM engine (v%s) with config: "
+                "model=%r, speculative_config=%r, tokenizer=%r, "
+                "skip_tokenizer_init=%s, tokenizer_mode=%s, revision=%s, "
+                "rope_scaling=%r, tokenizer_revision=%s, "
+                "trust_remote_code=%s, dtype=%s, max_seq_len=%d, "
+                "download_dir=%r, load_format=%s, tensor_parallel_size=%d, "
+                "disable_custom_all_reduce=%s, quantization=%s, "
+                "enforce_eager=%s, kv_cache_dtype=%s, "
+                "quantization_param_path=%s, device_config=%s, "
+                "decoding_config=%r, seed=%d, served_model_name=%s)",
+                vllm.__version__,
+                model_config.model,
+                speculative_config,
+                model_config.tokenizer,
+                model_config.skip_tokenizer_init,
+                model_config.tokenizer_mode,
+                model_config.revision,
+                model_config.rope_scaling,
+                model_config.tokenizer_revision,
+                model_config.trust_remote_code,
+                model_config.dtype,
+                model_config.max_model_len,
+                load_config.download_dir,
+                load_config.load_format,
+                parallel_config.tensor_parallel_size,
+                parallel_config.disable_custom_all_reduce,
+                model_config.quantization,
+                model_config.enforce_eager,
+                cache_config.cache_dtype,
+                model_config.quantization_param_path,
+                device_config.device,
+                decoding_config,
+                model_config.seed,
+                model_config.served_model_name,
+            )
         # TODO(woosuk): Print more configs in debug mode.
 
         self.model_config = model_config
@@ -216,6 +287,12 @@ class LLMEngine:
             self.detokenizer = None
 
         self.seq_counter = Counter()
+        # Maps lora_int_id (0 for the base model) to its EOS token id.
+        self._eos_token_id_cache: Dict[int, Optional[int]] = {}
+        self._tokenization_cache: Optional[_TokenizationCache] = None
+        if model_config.tokenization_cache_size > 0:
+            self._tokenization_cache = _TokenizationCache(
+                capacity=model_config.tokenization_cache_size)
         self.generation_config_fields = _load_generation_config_dict(
             model_config)
 
@@ -423,7 +500,41 @@ class LLMEngine:
                            "is not initialized")
             return None
 
-        return self.tokenizer.get_lora_tokenizer(lora_request).eos_token_id
+        lora_int_id = lora_request.lora_int_id if lora_request else 0
+        try:
+            return self._eos_token_id_cache[lora_int_id]
+        except KeyError:
+            eos_token_id = self.tokenizer.get_lora_tokenizer(
+                lora_request).eos_token_id
+            self._eos_token_id_cache[lora_int_id] = eos_token_id
+            return eos_token_id
+
+    def _get_cached_prompt_token_ids(
+            self, prompt: str,
+            lora_request: Optional[LoRARequest]) -> Optional[List[int]]:
+        if (self._tokenization_cache is None
+                or len(prompt) > _TOKENIZATION_CACHE_MAX_PROMPT_LEN):
+            return None
+
+        lora_int_id = lora_request.lora_int_id if lora_request else 0
+        prompt_token_ids = self._tokenization_cache.get_prompt_token_ids(
+            lora_int_id, prompt)
+        if prompt_token_ids is None:
+            return None
+
+        # Return a copy so that the cached entry cannot be mutated.
+        return list(prompt_token_ids)
+
+    def _cache_prompt_token_ids(self, prompt: str,
+                                lora_request: Optional[LoRARequest],
+                                prompt_token_ids: List[int]) -> None:
+        if (self._tokenization_cache is None
+                or len(prompt) > _TOKENIZATION_CACHE_MAX_PROMPT_LEN):
+            return
+
+        lora_int_id = lora_request.lora_int_id if lora_request else 0
+        self._tokenization_cache.put_prompt_token_ids(lora_int_id, prompt,
+                                                      tuple(prompt_token_ids))
 
     def _add_processed_request(
         self,
@@ -471,22 +582,43 @@ class LLMEngine:
         inputs: PromptInputs,
         lora_request: Optional[LoRARequest] = None,
     ) -> LLMInputs:
-        if isinstance(inputs, str):
-            inputs = {"prompt": inputs}
+        if isinstance(inputs, dict):
+            # Pre-tokenized prompts (e.g. from the OpenAI server) are the
+            # common case, so check for them first.
+            prompt_token_ids = inputs.get("prompt_token_ids")
+            if prompt_token_ids is None:
+                prompt_token_ids = self._tokenize_prompt(
+                    inputs["prompt"], request_id, lora_request)
+
+            return LLMInputs(prompt_token_ids=prompt_token_ids,
+                             prompt=inputs.get("prompt"),
+                             multi_modal_data=inputs.get("multi_modal_data"))
+
+        prompt_token_ids = self._tokenize_prompt(inputs, request_id,
+                                                 lora_request)
+        return LLMInputs(prompt_token_ids=prompt_token_ids,
+                         prompt=inputs,
+                         multi_modal_data=None)
 
-        if "prompt_token_ids" not in inputs:
-            tokenizer = self.get_tokenizer_group("prompts must be None if "
-                                                 "skip_tokenizer_init is True")
+    def _tokenize_prompt(
+        self,
+        prompt: str,
+        request_id: str,
+        lora_request: Optional[LoRARequest],
+    ) -> List[int]:
+        tokenizer = self.get_tokenizer_group("prompts must be None if "
+                                             "skip_tokenizer_init is True")
 
+        prompt_token_ids = self._get_cached_prompt_token_ids(
+            prompt, lora_request)
+        if prompt_token_ids is None:
             prompt_token_ids = tokenizer.encode(request_id=request_id,
-                                                prompt=inputs["prompt"],
+                                                prompt=prompt,
                                                 lora_request=lora_request)
-        else:
-            prompt_token_ids = inputs["prompt_token_ids"]
+            self._cache_prompt_token_ids(prompt, lora_request,
+                                         prompt_token_ids)
 
-        return LLMInputs(prompt_token_ids=prompt_token_ids,
-                         prompt=inputs.get("prompt"),
-                         multi_modal_data=inputs.get("multi_modal_data"))
+        return prompt_token_ids
 
     def add_request(
         self,
@@ -511,7 +643,7 @@ class LLMEngine:
                 :class:`~vllm.SamplingParams` for text generation.
                 :class:`~vllm.PoolingParams` for pooling.
             arrival_time: The arrival time of the request. If None, we use
-                the current monotonic time.
+                the current wall-clock time (:func:`time.time`).
 
         Details:
             - Set arrival_time to the current time if it is None.
@@ -652,7 +784,8 @@ class LLMEngine:
     ) -> None:
         seq_group.embeddings = outputs[0].embeddings
 
-        for seq in seq_group.get_seqs():
+        # Iterate the dict directly; get_seqs() would build a new list.
+        for seq in seq_group.seqs_dict.values():
             seq.status = SequenceStatus.FINISHED_STOPPED
 
         return
@@ -676,32 +809,45 @@ class LLMEngine:
         output_by_sequence_group = create_output_by_sequence_group(
             output, num_seq_groups=len(scheduled_seq_groups))
 
-        # Update the scheduled sequence groups with the model outputs.
+        # These are invariant across the loop below; bind them once instead
+        # of resolving the attribute chains for every sequence group.
+        embedding_mode = self.model_config.embedding_mode
+        output_processor = self.output_processor
+
+        request_outputs: List[Union[RequestOutput,
+                                    EmbeddingRequestOutput]] = []
+        has_finished_seq_groups = False
+
+        # Update the scheduled sequence groups with the model outputs and
+        # create their outputs in the same pass. A group's output only
+        # depends on its own state, so it can be built as soon as that group
+        # has been processed.
         for scheduled_seq_group, outputs, seq_group_meta in zip(
                 scheduled_seq_groups, output_by_sequence_group,
                 seq_group_metadata_list):
             seq_group = scheduled_seq_group.seq_group
             seq_group.update_num_computed_tokens(
                 scheduled_seq_group.token_chunk_size)
-            if self.model_config.embedding_mode:
+            if embedding_mode:
                 self._process_sequence_group_outputs(seq_group, outputs)
-                continue
+            else:
+                output_processor.process_prompt_logprob(seq_group, outputs)
+                if seq_group_meta.do_sample:
+                    output_processor.process_outputs(seq_group, outputs)
 
-            self.output_processor.process_prompt_logprob(seq_group, outputs)
-            if seq_group_meta.do_sample:
-                self.output_processor.process_outputs(seq_group, outputs)
-
-        # Free the finished sequence groups.
-        self.scheduler.free_finished_seq_groups()
-
-        # Create the outputs.
-        request_outputs: List[Union[RequestOutput,
-                                    EmbeddingRequestOutput]] = []
-        for scheduled_seq_group in scheduled_seq_groups:
-            seq_group = scheduled_seq_group.seq_group
             seq_group.maybe_set_first_token_time(now)
             request_output = RequestOutputFactory.create(seq_group)
             request_outputs.append(request_output)
+            if request_output.finished:
+                has_finished_seq_groups = True
+
+        # Free the finished sequence groups. Only groups scheduled in this
+        # step can have finished (aborted groups are removed eagerly), so the
+        # scheduler's running queue only needs rebuilding when one of them
+        # did.
+        if has_finished_seq_groups:
+            self.scheduler.free_finished_seq_groups()
+
         for seq_group in ignored_seq_groups:
             request_output = RequestOutputFactory.create(seq_group)
             request_outputs.append(request_output)
@@ -852,6 +998,7 @@ class LLMEngine:
         best_of_requests: List[int] = []
         n_requests: List[int] = []
         finished_reason_requests: List[str] = []
+        get_finished_reason = SequenceStatus.get_finished_reason
 
         # NOTE: This loop assumes prefill seq_groups are before
         # decode seq_groups in scheduled_seq_groups.
@@ -862,58 +1009,65 @@ class LLMEngine:
             # scheduler_outputs.num_prefill_groups, this means that
             # chunked prefills have been detected.
 
-            for idx, scheduled_seq_group in enumerate(
-                    scheduler_outputs.scheduled_seq_groups):
-                group_was_prefill = idx < scheduler_outputs.num_prefill_groups
+            scheduled_seq_groups = scheduler_outputs.scheduled_seq_groups
+            num_prefill_groups = scheduler_outputs.num_prefill_groups
+            prefill_groups = scheduled_seq_groups[:num_prefill_groups]
+            decode_groups = scheduled_seq_groups[num_prefill_groups:]
+            finished_seq_groups: List[SequenceGroup] = []
+
+            # Prefill groups.
+            for scheduled_seq_group in prefill_groups:
                 seq_group = scheduled_seq_group.seq_group
 
+                # Number of prompt tokens.
+                num_prompt_tokens_iter += scheduled_seq_group.token_chunk_size
+
                 # NOTE: a seq_group that completed all of its prefill tokens
                 # in the last iteration will have seq_group.is_prefill() = False
-                # with group_was_prefill = True
-                if group_was_prefill:
-                    # Number of prompt tokens.
-                    num_prompt_tokens_iter += (
-                        scheduled_seq_group.token_chunk_size)
-
-                    # If the seq_group just finished the prefill state
-                    # get TTFT.
-                    if not seq_group.is_prefill():
-                        latency = seq_group.get_last_latency(now)
-                        time_to_first_tokens_iter.append(latency)
-
-                        # One generation token per finished prefill.
-                        num_generation_tokens_from_prefill_groups += (
-                            seq_group.num_seqs())
-                else:
-                    # TPOTs.
+                # even though it was scheduled as a prefill. In that case the
+                # seq_group just finished the prefill state, so get TTFT.
+                if not seq_group.is_prefill():
                     latency = seq_group.get_last_latency(now)
-                    time_per_output_tokens_iter.append(latency)
+                    time_to_first_tokens_iter.append(latency)
+
+                    # One generation token per finished prefill.
+                    num_generation_tokens_from_prefill_groups += (
+                        seq_group.num_seqs())
+
+                if seq_group.is_finished():
+                    finished_seq_groups.append(seq_group)
+
+            # Decode groups.
+            for scheduled_seq_group in decode_groups:
+                seq_group = scheduled_seq_group.seq_group
+
+                # TPOTs.
+                latency = seq_group.get_last_latency(now)
+                time_per_output_tokens_iter.append(latency)
 
-                # Because of chunked prefill, we can have a single sequence
-                # group that does multiple prompt_runs. To prevent logging
-                # the same metadata more than once per request, we standardize
-                # on logging request level information for finished requests,
-                # which can only happen once.
                 if seq_group.is_finished():
-                    # Latency timings
-                    time_e2e_requests.append(now -
-                                             seq_group.metrics.arrival_time)
-
-                    # Metadata
-                    num_prompt_tokens_requests.append(
-                        len(seq_group.prompt_token_ids))
-                    num_generation_tokens_requests.extend([
-                        seq.get_output_len()
-                        for seq in seq_group.get_finished_seqs()
-                    ])
-                    if seq_group.sampling_params is not None:
-                        best_of_requests.append(
-                            seq_group.sampling_params.best_of)
-                        n_requests.append(seq_group.sampling_params.n)
-                    finished_reason_requests.extend([
-                        SequenceStatus.get_finished_reason(seq.status)
-                        for seq in seq_group.get_finished_seqs()
-                    ])
+                    finished_seq_groups.append(seq_group)
+
+            # Because of chunked prefill, we can have a single sequence
+            # group that does multiple prompt_runs. To prevent logging
+            # the same metadata more than once per request, we standardize
+            # on logging request level information for finished requests,
+            # which can only happen once.
+            for seq_group in finished_seq_groups:
+                # Latency timings
+                time_e2e_requests.append(now - seq_group.metrics.arrival_time)
+
+                # Metadata
+                num_prompt_tokens_requests.append(
+                    len(seq_group.prompt_token_ids))
+                sampling_params = seq_group.sampling_params
+                if sampling_params is not None:
+                    best_of_requests.append(sampling_params.best_of)
+                    n_requests.append(sampling_params.n)
+                for seq in seq_group.get_finished_seqs():
+                    num_generation_tokens_requests.append(seq.get_output_len())
+                    finished_reason_requests.append(
+                        get_finished_reason(seq.status))
 
             # Number of generation tokens.
             #   num_batched_tokens equals the number of prompt_tokens plus the
@@ -967,6 +1121,9 @@ class LLMEngine:
         return self.model_executor.add_lora(lora_request)
 
     def remove_lora(self, lora_id: int) -> bool:
+        self._eos_token_id_cache.pop(lora_id, None)
+        if self._tokenization_cache is not None:
+            self._tokenization_cache.remove_lora(lora_id)
         return self.model_executor.remove_lora(lora_id)
 
     def list_loras(self) -> List[int]:
@@ -169,6 +169,30 @@ def build_1_2_5_buckets(max_value: int):
 @dataclass
 class Stats:
     """Created by LLMEngine for use by StatLogger."""
+    # A Stats object is created on every engine step, so avoid giving each
+    # instance a __dict__. Fields cannot have defaults while __slots__ is
+    # declared by hand (dataclass(slots=True) needs Python 3.10).
+    __slots__ = (
+        "now",
+        "num_running_sys",
+        "num_waiting_sys",
+        "num_swapped_sys",
+        "gpu_cache_usage_sys",
+        "cpu_cache_usage_sys",
+        "num_prompt_tokens_iter",
+        "num_generation_tokens_iter",
+        "time_to_first_tokens_iter",
+        "time_per_output_tokens_iter",
+        "num_preemption_iter",
+        "time_e2e_requests",
+        "num_prompt_tokens_requests",
+        "num_generation_tokens_requests",
+        "best_of_requests",
+        "n_requests",
+        "finished_reason_requests",
+        "spec_decode_metrics",
+    )
+
     now: float
 
     # System stats (should have _sys suffix)
@@ -197,7 +221,7 @@ class Stats:
     n_requests: List[int]
     finished_reason_requests: List[str]
 
-    spec_decode_metrics: Optional["SpecDecodeWorkerMetrics"] = None
+    spec_decode_metrics: Optional["SpecDecodeWorkerMetrics"]
 
 
 class SupportsMetricsInfo(Protocol):
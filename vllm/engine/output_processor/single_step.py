@@ -98,12 +98,15 @@ class SingleStepOutputProcessor(SequenceGroupOutputProcessor):
                 self.scheduler.free_seq(parent)
                 continue
             # Fork the parent sequence if there are multiple child samples.
-            for child_sample in child_samples[:-1]:
-                new_child_seq_id: int = next(self.seq_counter)
-                child = parent.fork(new_child_seq_id)
-                child.append_token_id(child_sample.output_token,
-                                      child_sample.logprobs)
-                child_seqs.append((child, parent))
+            if len(child_samples) > 1:
+                new_child_seq_ids = self.seq_counter.next_n(
+                    len(child_samples) - 1)
+                for new_child_seq_id, child_sample in zip(
+                        new_child_seq_ids, child_samples[:-1]):
+                    child = parent.fork(new_child_seq_id)
+                    child.append_token_id(child_sample.output_token,
+                                          child_sample.logprobs)
+                    child_seqs.append((child, parent))
             # Continue the parent sequence for the last child sample.
             # We reuse the parent sequence here to reduce redundant memory
             # copies, especially when using non-beam search sampling methods.
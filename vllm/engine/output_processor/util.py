@@ -11,6 +11,21 @@ def create_output_by_sequence_group(
     """Helper method which transforms a 2d list organized by
     [step][sequence group] into [sequence group][step].
     """
+    if outputs and all(len(step) == num_seq_groups for step in outputs):
+        if len(outputs) == 1:
+            # Fast path for single-step decoding: every sequence group has
+            # exactly one output, so there is nothing to interleave.
+            return [[sequence_group_output]
+                    for sequence_group_output in outputs[0].outputs]
+
+        # Every step has an output for every sequence group, so the
+        # transpose can be done by zip in C.
+        return [
+            list(sequence_group_outputs)
+            for sequence_group_outputs in zip(*(step.outputs
+                                                for step in outputs))
+        ]
+
     output_by_sequence_group: List[List[SequenceGroupOutput]] = [
         [] for _ in range(num_seq_groups)
     ]
@@ -1,5 +1,6 @@
 from contextlib import contextmanager
-from typing import ClassVar, List, Optional, Sequence, Union, cast, overload
+from typing import (ClassVar, Dict, List, Optional, Sequence, Union, cast,
+                    overload)
 
 from tqdm import tqdm
 from transformers import PreTrainedTokenizer, PreTrainedTokenizerFast
@@ -513,6 +514,8 @@ class LLM:
             raise ValueError("The lengths of prompts and params "
                              "must be the same.")
 
+        inputs = self._tokenize_inputs(inputs, lora_request)
+
         # Add requests to the engine.
         for i, request_inputs in enumerate(inputs):
             self._add_request(
@@ -521,6 +524,71 @@ class LLM:
                 lora_request=lora_request,
             )
 
+    def _tokenize_inputs(
+        self,
+        inputs: Sequence[PromptInputs],
+        lora_request: Optional[LoRARequest],
+    ) -> Sequence[PromptInputs]:
+        """Tokenize all text prompts with a single batched tokenizer call
+        instead of one call per request.
+
+        Prompts found in the engine's tokenization cache are not re-encoded,
+        and newly encoded prompts are added to it.
+        """
+        engine = self.llm_engine
+        tokenizer = engine.tokenizer
+        if tokenizer is None:
+            # The engine raises the appropriate error for text prompts.
+            return inputs
+
+        text_indices = [
+            i for i, request_inputs in enumerate(inputs)
+            if isinstance(request_inputs, str)
+            or request_inputs.get("prompt_token_ids") is None
+        ]
+        if len(text_indices) <= 1:
+            return inputs
+
+        prompts: List[str] = []
+        prompt_token_ids: List[Optional[List[int]]] = []
+        for i in text_indices:
+            request_inputs = inputs[i]
+            prompt = (request_inputs if isinstance(request_inputs, str) else
+                      request_inputs["prompt"])
+            token_ids = engine._get_cached_prompt_token_ids(
+                prompt, lora_request)
+            prompts.append(prompt)
+            prompt_token_ids.append(token_ids)
+
+        # Encode each prompt that missed the cache once, even if it repeats.
+        missed_prompts = list(
+            dict.fromkeys(
+                prompt for prompt, token_ids in zip(prompts, prompt_token_ids)
+                if token_ids is None))
+        encoded: Dict[str, List[int]] = {}
+        if missed_prompts:
+            missed_token_ids = tokenizer.encode_batch(
+                missed_prompts, lora_request=lora_request)
+            for prompt, token_ids in zip(missed_prompts, missed_token_ids):
+                encoded[prompt] = token_ids
+                engine._cache_prompt_token_ids(prompt, lora_request, token_ids)
+
+        tokenized_inputs = list(inputs)
+        for i, prompt, token_ids in zip(text_indices, prompts,
+                                        prompt_token_ids):
+            if token_ids is None:
+                # Give each request its own list, even for repeated prompts.
+                token_ids = list(encoded[prompt])
+            request_inputs = inputs[i]
+            item = TextTokensPrompt(prompt=prompt, prompt_token_ids=token_ids)
+            if (not isinstance(request_inputs, str)
+                    and "multi_modal_data" in request_inputs):
+                item["multi_modal_data"] = request_inputs["multi_modal_data"]
+
+            tokenized_inputs[i] = item
+
+        return tokenized_inputs
+
     def _add_request(
         self,
         inputs: PromptInputs,
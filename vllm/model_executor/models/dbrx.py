@@ -70,6 +70,7 @@ class DbrxExperts(nn.Module):
     ):
         super().__init__()
         self.tp_size = get_tensor_model_parallel_world_size()
+        self.tp_rank = get_tensor_model_parallel_rank()
         self.num_total_experts = config.ffn_config.moe_num_experts
         self.top_k = config.ffn_config.moe_top_k
         self.d_model = config.d_model
@@ -113,36 +114,27 @@ class DbrxExperts(nn.Module):
 
     def weight_loader(self, param: nn.Parameter, loaded_weight: torch.Tensor,
                       weight_name: str):
-        tp_rank = get_tensor_model_parallel_rank()
         param_data = param.data
         shard_size = self.intermediate_size
-        shard = slice(tp_rank * shard_size, (tp_rank + 1) * shard_size)
+        shard = slice(self.tp_rank * shard_size,
+                      (self.tp_rank + 1) * shard_size)
         # DBRX uses GLU for each experts.
-        # GLU has 3 linear layers: w1, v1 and w2.
-        if weight_name.endswith("w1"):
-            loaded_weight = torch.reshape(
-                loaded_weight,
-                [-1, self.intermediate_size * self.tp_size, self.d_model],
-            )
-            param_data[:, 0:shard_size, :] = loaded_weight[:, shard, :]
-        if weight_name.endswith("v1"):
-            loaded_weight = torch.reshape(
-                loaded_weight,
-                [-1, self.intermediate_size * self.tp_size, self.d_model],
-            )
-            param_data[:,
-                       shard_size:2 * shard_size, :] = loaded_weight[:,
-                                                                     shard, :]
+        # GLU has 3 linear layers: w1, v1 and w2. w1 and v1 are stacked into
+        # ws; each checkpoint tensor holds all experts as
+        # [num_experts * ffn_hidden_size, d_model].
+        loaded_weight = torch.reshape(
+            loaded_weight,
+            [-1, self.intermediate_size * self.tp_size, self.d_model],
+        )
         if weight_name.endswith("w2"):
-            loaded_weight = torch.reshape(
-                loaded_weight,
-                [-1, self.intermediate_size * self.tp_size, self.d_model],
-            ).transpose(1, 2)
-            param_data[:] = loaded_weight[:, :, shard]
+            param_data.copy_(loaded_weight[:, shard, :].transpose(1, 2))
+        else:
+            offset = 0 if weight_name.endswith("w1") else shard_size
+            param_data.narrow(1, offset,
+                              shard_size).copy_(loaded_weight[:, shard, :])
 
     def forward(self, hidden_states: torch.Tensor) -> torch.Tensor:
-        num_tokens, hidden_size = hidden_states.shape
-        hidden_states = hidden_states.view(-1, self.d_model)
+        # hidden_states: (num_tokens, d_model)
         # router_logits: (num_tokens, n_experts)
         router_logits = self.router(hidden_states)
         final_hidden_states = fused_moe(
@@ -159,7 +151,7 @@ class DbrxExperts(nn.Module):
             final_hidden_states = tensor_model_parallel_all_reduce(
                 final_hidden_states)
 
-        return final_hidden_states.view(num_tokens, hidden_size)
+        return final_hidden_states
 
 
 class DbrxAttention(nn.Module):
@@ -217,6 +209,7 @@ class DbrxAttention(nn.Module):
         self.num_kv_heads = max(1, self.total_num_kv_heads // tp_world_size)
         self.q_size = self.num_heads * self.head_dim
         self.kv_size = self.num_kv_heads * self.head_dim
+        self.qkv_split_sizes = [self.q_size, self.kv_size, self.kv_size]
         self.scaling = self.head_dim**-0.5
         self.attn = Attention(self.num_heads,
                               self.head_dim,
@@ -235,7 +228,7 @@ class DbrxAttention(nn.Module):
         qkv, _ = self.Wqkv(hidden_states)
         if self.clip_qkv is not None:
             qkv.clamp_(min=-self.clip_qkv, max=self.clip_qkv)
-        q, k, v = qkv.split([self.q_size, self.kv_size, self.kv_size], dim=-1)
+        q, k, v = qkv.split(self.qkv_split_sizes, dim=-1)
         q, k = self.rotary_emb(position_ids, q, k)
         attn_output = self.attn(q, k, v, kv_cache, attn_metadata)
         hidden_states, _ = self.out_proj(attn_output)
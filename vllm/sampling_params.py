@@ -303,18 +303,24 @@ class SamplingParams:
         return SamplingType.RANDOM
 
     def clone(self) -> "SamplingParams":
-        """Deep copy excluding LogitsProcessor objects.
+        """Copy excluding LogitsProcessor objects.
 
         LogitsProcessor objects are excluded because they may contain an
         arbitrary, nontrivial amount of data.
         See https://github.com/vllm-project/vllm/issues/3087
-        """
 
-        logit_processor_refs = None if self.logits_processors is None else {
-            id(lp): lp
-            for lp in self.logits_processors
-        }
-        return copy.deepcopy(self, memo=logit_processor_refs)
+        All other attributes are immutable except for the stop lists and sets,
+        so a shallow copy plus copies of those containers is equivalent to a
+        deep copy and much cheaper on the per-request path.
+        """
+        params = copy.copy(self)
+        params.stop = self.stop.copy()
+        params.stop_token_ids = self.stop_token_ids.copy()
+        params.all_stop_token_ids = self.all_stop_token_ids.copy()
+        if self.logits_processors is not None:
+            # Callers may pass any sequence (e.g. a tuple) of processors.
+            params.logits_processors = list(self.logits_processors)
+        return params
 
     def __repr__(self) -> str:
         return (
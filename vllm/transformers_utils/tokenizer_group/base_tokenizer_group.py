@@ -29,6 +29,20 @@ class BaseTokenizerGroup(ABC):
         """Encode a prompt using the tokenizer group."""
         pass
 
+    def encode_batch(
+            self,
+            prompts: List[str],
+            lora_request: Optional[LoRARequest] = None) -> List[List[int]]:
+        """Encode a batch of prompts using the tokenizer group.
+
+        The default implementation encodes the prompts one at a time;
+        subclasses may override it with a single batched tokenizer call.
+        """
+        return [
+            self.encode(prompt=prompt, lora_request=lora_request)
+            for prompt in prompts
+        ]
+
     @abstractmethod
     async def encode_async(
             self,
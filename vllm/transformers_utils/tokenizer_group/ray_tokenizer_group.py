@@ -107,6 +107,30 @@ class RayTokenizerGroupPool(BaseTokenizerGroup):
             self._idle_actors.put_nowait(actor)
         return ret
 
+    def encode_batch(
+            self,
+            prompts: List[str],
+            lora_request: Optional[LoRARequest] = None) -> List[List[int]]:
+        """Encode a batch of prompts using the tokenizer group.
+
+        The whole batch is sent to a single idle actor.
+        This is blocking.
+        """
+        self._ensure_queue_initialized()
+        assert self._idle_actors is not None
+
+        if self._idle_actors.empty():
+            raise RuntimeError("No idle actors available.")
+        actor = self._idle_actors.get_nowait()
+        try:
+            ret = ray.get(
+                actor.encode_batch.remote(prompts=prompts,
+                                          lora_request=lora_request))
+        finally:
+            # Put the actor back in the queue.
+            self._idle_actors.put_nowait(actor)
+        return ret
+
     async def encode_async(
             self,
             prompt: str,
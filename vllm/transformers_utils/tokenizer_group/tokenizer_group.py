@@ -55,6 +55,16 @@ class TokenizerGroup(BaseTokenizerGroup):
         self._raise_if_input_too_long(ret, lora_request)
         return ret
 
+    def encode_batch(
+            self,
+            prompts: List[str],
+            lora_request: Optional[LoRARequest] = None) -> List[List[int]]:
+        tokenizer = self.get_lora_tokenizer(lora_request)
+        ret = tokenizer(prompts).input_ids
+        for encoded_tokens in ret:
+            self._raise_if_input_too_long(encoded_tokens, lora_request)
+        return ret
+
     async def encode_async(
             self,
             prompt: str,
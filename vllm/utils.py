@@ -51,6 +51,12 @@ class Counter:
         self.counter += 1
         return i
 
+    def next_n(self, n: int) -> range:
+        """Reserve the next ``n`` values at once."""
+        start = self.counter
+        self.counter += n
+        return range(start, start + n)
+
     def reset(self) -> None:
         self.counter = 0
 